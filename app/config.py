@@ -5,6 +5,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     db_url: str
+    db_generate_schemas: bool = False
     env_agent: str
     env_docs: str | None = None
     env_hosts: str = "*"
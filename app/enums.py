@@ -2,6 +2,11 @@ from enum import Enum, IntEnum
 from datetime import datetime
 
 
+class BudgetStatusEnum(Enum):
+    ON_TRACK = "on track"
+    OVERSPENT = "overspent"
+
+
 class LoansAndRenewalsEnum(Enum):
     INSRUANCE = "insurance"
     SUBSCRIPTION = "subscription"
@@ -1,15 +1,18 @@
+import inspect
 import logging
 import newrelic.agent
 from time import sleep
+from typing import Literal
 from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from tortoise import Tortoise
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Response, Depends, Query, Request, Header, HTTPException
+from fastapi import FastAPI, Depends, Query, Request, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from uuid import UUID
 from app.config import settings
-from app.reactadmin.helpers import ReactAdmin as ra
+from app.reactadmin.helpers import Commons, ReactAdmin as ra
 from app.enums import (
     PeriodMonthOptionsIntEnum,
     SpecificMonthOptionsEnum,
@@ -17,6 +20,7 @@ from app.enums import (
 )
 from app.ynab.main import YNAB as ynab
 from app.ynab.helpers import YnabHelpers as ynab_help
+from app.ynab.schemas import build_schemas
 
 dotenv_token = settings.env_token
 dotenv_hosts = settings.env_hosts
@@ -83,10 +87,14 @@ async def lifespan(app: FastAPI):
         db_url=settings.db_url,
         modules={"models": ["app.db.models"]},
     )
-    # Generate the model schemas.
-    logging.info("Generating schemas.")
-    await Tortoise.generate_schemas()
-    logging.info("Schemas generated.")
+    # Only generate the model schemas when asked to, the tables already exist
+    # for every other start up.
+    if settings.db_generate_schemas:
+        logging.info("Generating schemas.")
+        await Tortoise.generate_schemas(safe=True)
+        logging.info("Schemas generated.")
+    logging.info("Building response schemas.")
+    build_schemas()
     logging.info("Starting scheduler.")
     if settings.newrelic_env != "development":
         scheduler.add_job(update_account_data, trigger="cron", hour="*", minute=4)
@@ -150,6 +158,7 @@ app = FastAPI(
     lifespan=lifespan,
     dependencies=[Depends(get_token_header)],
     openapi_url=dotenv_docs,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -174,10 +183,17 @@ app.add_middleware(
 async def common_ra_parameters(
     _end: int = 10,
     _start: int = 0,
-    _order: str = Query(default="ASC", min_length=3, max_length=4, regex="ASC|DESC"),
+    _order: Literal["ASC", "DESC"] = "ASC",
     _sort: str = None,
-):
-    return {"_end": _end, "_start": _start, "_order": _order, "_sort": _sort}
+) -> Commons:
+    return Commons(end=_end, start=_start, order=_order, sort=_sort)
+
+
+# The query params common_ra_parameters handles, as opposed to filters. Taken from
+# its signature so they stay in step.
+RA_PARAMETERS = frozenset(inspect.signature(common_ra_parameters).parameters)
+# Every get_list query param which isn't a filter.
+RA_LIST_PARAMETERS = RA_PARAMETERS | {"id"}
 
 
 async def common_cc_parameters(
@@ -195,58 +211,70 @@ async def get_health():
 
 @app.post("/portal/admin/{resource}", status_code=201, include_in_schema=False)
 async def create(resource: str, _body: dict):
-    return await ra.create(resource, _body)
+    entity = await ra.create(resource, _body)
+    ynab.clear_dashboard_cache()
+    return entity
 
 
-@app.get("/portal/admin/{resource}/{_id}")
+@app.get("/portal/admin/{resource}/{_id}", response_model=None)
 async def get_one(resource: str, _id: UUID):
-    return await ra.get_one(resource, _id)
+    entity = await ra.get_one(resource, _id)
+    return ORJSONResponse(entity.model_dump(mode="json"))
 
 
-@app.get("/portal/admin/{resource}")
+@app.get("/portal/admin/{resource}", response_model=None)
 async def get_list(
     request: Request,
-    response: Response,
     resource: str,
-    commons: dict = Depends(common_ra_parameters),
+    commons: Commons = Depends(common_ra_parameters),
     _id: list[UUID] | None = Query(default=None, alias="id"),
 ):
 
-    # Instansiate the kwargs object, incase no kwargs are passed
-    kwargs = {}
-    # Iterate through the query parameters
-    for query, value in request.query_params.items():
-        # Skip any that are in commons, as well as if they are "id"
-        if query not in commons.keys() and query != "id":
-            kwargs[query] = value
-        # This can sometimes be a list of id's so we want to capture all of them in a list.
-        elif query == "id":
-            kwargs["id"] = _id
+    query_params = request.query_params
+    # Most list requests only send the commons, so skip looking for filters.
+    if query_params.keys() <= RA_LIST_PARAMETERS:
+        kwargs = {}
+    else:
+        # Skip any query params that are in commons, as well as "id".
+        kwargs = {
+            query: value
+            for query, value in query_params.items()
+            if query not in RA_LIST_PARAMETERS
+        }
+    # This can sometimes be a list of id's so we want to capture all of them in a list.
+    if _id is not None:
+        kwargs["id"] = _id
 
     # Get the entities and the count.
     entities, count = await ra.get_list(resource, commons, kwargs)
 
     # List responses require the count to be set in the header using a custom param.
-    response.headers["X-Total-Count"] = count
-    return entities
+    return ORJSONResponse(
+        [entity.model_dump(mode="json") for entity in entities],
+        headers={"X-Total-Count": count},
+    )
 
 
-@app.put("/portal/admin/{resource}/{_id}", include_in_schema=False)
+@app.put("/portal/admin/{resource}/{_id}", response_model=None, include_in_schema=False)
 async def update(resource: str, _body: dict, _id: UUID):
-    return await ra.update(resource, _body, _id)
+    entity = await ra.update(resource, _body, _id)
+    ynab.clear_dashboard_cache()
+    return ORJSONResponse(entity.model_dump(mode="json"))
 
 
 @app.delete("/portal/admin/{resource}/{_id}", include_in_schema=False)
 async def delete(resource: str, _id: UUID):
-    return await ra.delete(resource, _id)
+    rows_deleted = await ra.delete(resource, _id)
+    ynab.clear_dashboard_cache()
+    return rows_deleted
 
 
 @app.delete("/portal/admin/{resource}", include_in_schema=False)
 async def delete_many(
     resource: str, _ids: list[UUID] = Query(default=None, alias="ids")
 ):
-    for _id in _ids:
-        rows_deleted = await ra.delete(resource, _id)
+    rows_deleted = await ra.delete_many(resource, _ids)
+    ynab.clear_dashboard_cache()
     return {"message": f"Deleted {rows_deleted} rows."}
 
 
@@ -437,29 +465,39 @@ async def update_accounts():
 
 @app.get("/ynab/update-accounts", name="Update YNAB Accounts")
 async def update_accounts():
-    return await ynab_help.pydantic_accounts()
+    entities = await ynab_help.pydantic_accounts()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/ynab/update-categories", name="Update YNAB Categories")
 async def update_categories():
-    return await ynab_help.pydantic_categories()
+    entities = await ynab_help.pydantic_categories()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/ynab/update-month-details", name="Update YNAB Month Details")
 async def update_month_details():
     # Does previous month category summaries. Will only do previous months.
-    return await ynab_help.pydantic_month_details()
+    entities = await ynab_help.pydantic_month_details()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/ynab/update-month-summaries", name="Update YNAB Month Summaries")
 async def update_month_summaries():
     # Does the current year summaries
-    return await ynab_help.pydantic_month_summaries()
+    entities = await ynab_help.pydantic_month_summaries()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/ynab/update-payees", name="Update YNAB Payees")
 async def update_payees():
-    return await ynab_help.pydantic_payees()
+    entities = await ynab_help.pydantic_payees()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/ynab/update-savings", name="Update Savings Outcomes")
@@ -473,7 +511,7 @@ async def update_savings(commons: dict = Depends(common_cc_parameters)):
 
     entities, count = await ra.get_list(
         resource="savings",
-        commons={"_end": 1, "_start": 0, "_order": "ASC", "_sort": "date"},
+        commons=Commons(end=1, start=0, order="ASC", sort="date"),
         kwargs_raw={
             "date__month": month.value,
             "date__year": year.value,
@@ -506,12 +544,16 @@ async def update_savings(commons: dict = Depends(common_cc_parameters)):
 async def update_transactions():
     await ynab_help.pydantic_transactions()
     # Below needs categories to exist.
-    return await ynab_help.sync_transaction_rels()
+    entities = await ynab_help.sync_transaction_rels()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/ynab/update-transaction-rels", name="Update YNAB Transaction Relations")
 async def update_transaction_rels():
-    return await ynab_help.sync_transaction_rels()
+    entities = await ynab_help.sync_transaction_rels()
+    ynab.clear_dashboard_cache()
+    return entities
 
 
 @app.get("/test/endpoint")
@@ -1,4 +1,5 @@
 import logging
+from dataclasses import dataclass
 from datetime import datetime, UTC
 from tortoise.models import Model
 from tortoise.exceptions import (
@@ -46,6 +47,15 @@ from app.db.schemas import (
 )
 
 
+@dataclass(slots=True, frozen=True)
+class Commons:
+    # The pagination and sort params react-admin sends with every list request.
+    end: int
+    start: int
+    order: str
+    sort: str | None
+
+
 class ReactAdmin:
     EXCLUDE_BUDGETS = [
         "Monthly Bills",
@@ -120,7 +130,7 @@ class ReactAdmin:
         return db_entity
 
     @classmethod
-    async def get_list(cls, resource: str, commons: dict, kwargs_raw: dict) -> tuple:
+    async def get_list(cls, resource: str, commons: Commons, kwargs_raw: dict) -> tuple:
         # When an list of id's are provided, go straight to the get_many function.
         if "id" in kwargs_raw and type(kwargs_raw["id"]) is list:
             return await cls.get_many(resource, kwargs_raw["id"])
@@ -135,7 +145,7 @@ class ReactAdmin:
             entity_model,
             resource,
             limit,
-            commons["_start"],
+            commons.start,
             order_by,
             kwargs if kwargs != {} else None,
         )
@@ -250,12 +260,12 @@ class ReactAdmin:
         return kwargs
 
     @classmethod
-    async def get_order_limit_value(cls, commons: dict):
+    async def get_order_limit_value(cls, commons: Commons):
         order_by = None
-        if commons["_order"] or commons["_sort"]:
-            order_by = await cls.get_sort_value(commons["_order"], commons["_sort"])
+        if commons.order or commons.sort:
+            order_by = await cls.get_sort_value(commons.order, commons.sort)
 
-        limit = commons["_end"] - commons["_start"]
+        limit = commons.end - commons.start
 
         if limit < 0:
             logging.info("Limit value cannot be less than 0.")
@@ -364,3 +374,12 @@ class ReactAdmin:
         if not deleted_count:
             logging.info("Couldn't find entity to delete.")
         return deleted_count
+
+    @classmethod
+    async def delete_many(cls, resource: str, ids: list[UUID]):
+        entity_model = await cls.get_entity_model(resource)
+
+        deleted_count = await entity_model.filter(id__in=ids).delete()
+        if deleted_count < len(ids):
+            logging.info("Couldn't find all the entities to delete.")
+        return deleted_count
@@ -9,7 +9,7 @@ from dateutil.relativedelta import relativedelta
 from pydantic import TypeAdapter
 from fastapi import HTTPException
 from tortoise.models import Model
-from app.ynab.serverknowledge import YnabServerKnowledgeHelper
+from app.ynab import serverknowledge
 from app.db.models import (
     LoansAndRenewals,
     YnabServerKnowledge,
@@ -40,6 +40,17 @@ from app.enums import (
 )
 from app.config import settings
 
+# The list adapters for the pydantic models the DB entities are returned as. Built
+# once here, rather than compiling a new validator on every request.
+PYDANTIC_LIST_ADAPTERS = {
+    "accounts-list": TypeAdapter(list[Account]),
+    "categories-list": TypeAdapter(list[Category]),
+    "months-list": TypeAdapter(list[MonthSummary]),
+    "months-single": TypeAdapter(list[MonthDetail]),
+    "payees-list": TypeAdapter(list[Payee]),
+    "transactions-list": TypeAdapter(list[TransactionDetail]),
+}
+
 
 class YnabHelpers:
     @classmethod
@@ -259,19 +270,10 @@ class YnabHelpers:
                 return "/user"
 
     @classmethod
-    async def get_pydantic_model(cls, action: str) -> Model | HTTPException:
-        model_list = {
-            "accounts-list": Account,
-            "categories-list": Category,
-            "months-list": MonthSummary,
-            "months-single": MonthDetail,
-            "payees-list": Payee,
-            "transactions-list": TransactionDetail,
-        }
-
+    async def get_pydantic_adapter(cls, action: str) -> TypeAdapter | HTTPException:
         try:
-            logging.debug(f"Attempting to get pydantic model for {action}")
-            return model_list[action]
+            logging.debug(f"Attempting to get pydantic adapter for {action}")
+            return PYDANTIC_LIST_ADAPTERS[action]
         except KeyError:
             logging.warning(f"Pydantic model for {action} doesn't exist.")
             raise HTTPException(status_code=400)
@@ -281,9 +283,7 @@ class YnabHelpers:
         cls, action: str, param_1: str = None
     ) -> YnabServerKnowledge | None:
         sk_route = await cls.get_route(action, param_1)
-        server_knowledge = await YnabServerKnowledgeHelper.check_if_exists(
-            route_url=sk_route
-        )
+        server_knowledge = await serverknowledge.check_if_exists(route_url=sk_route)
 
         # Return None if no entry of SK exists.
         if not server_knowledge:
@@ -324,9 +324,7 @@ class YnabHelpers:
         ynab_route = await cls.get_route(action, param_1, param_2, since_date, month)
         ynab_url = settings.ext_ynab_url + ynab_route
 
-        sk_eligible = await YnabServerKnowledgeHelper.check_route_eligibility(
-            action=action
-        )
+        sk_eligible = serverknowledge.check_route_eligibility(action=action)
         server_knowledge = await cls.check_server_knowledge_status(
             action=action, param_1=param_1
         )
@@ -335,7 +333,7 @@ class YnabHelpers:
             logging.debug(
                 f"Updating ynab url to include server_knowledge value: {ynab_url}"
             )
-            ynab_url = await YnabServerKnowledgeHelper.add_server_knowledge_to_url(
+            ynab_url = serverknowledge.add_server_knowledge_to_url(
                 ynab_url=ynab_url, server_knowledge=server_knowledge.server_knowledge
             )
 
@@ -387,7 +385,7 @@ class YnabHelpers:
                     )
 
                 return await cls.return_pydantic_model_entities(
-                    json_response=response.json(), action=action
+                    response=response, action=action
                 )
 
     @classmethod
@@ -410,16 +408,14 @@ class YnabHelpers:
         # TODO maybe look at removing the fact it returns them as models a
         # TODO they are likely not used anywhere.
         """
-        action_data_name = await YnabServerKnowledgeHelper.get_route_data_name(action)
+        action_data_name = serverknowledge.get_route_data_name(action)
         test_response = response.json()
         logging.debug(test_response)
         resp_entity_list = response.json()["data"][action_data_name]
-        await YnabServerKnowledgeHelper.process_entities(
-            action=action, entities=resp_entity_list
-        )
+        await serverknowledge.process_entities(action=action, entities=resp_entity_list)
         resp_server_knowledge = response.json()["data"]["server_knowledge"]
         sk_route = await cls.get_route(action, param_1)
-        await YnabServerKnowledgeHelper.create_update_server_knowledge(
+        await serverknowledge.create_update_server_knowledge(
             route=sk_route,
             server_knowledge=resp_server_knowledge,
             db_entity=server_knowledge,
@@ -470,7 +466,7 @@ class YnabHelpers:
         for category in json_month_list:
             category["month_summary_fk"] = month_summary_entity
 
-        await YnabServerKnowledgeHelper.process_entities(
+        await serverknowledge.process_entities(
             action="months-single", entities=json_month_list
         )
         return {"message": "Complete"}
@@ -585,7 +581,7 @@ class YnabHelpers:
         cls, action: str, since_date: str = None, month: Enum = None, year: Enum = None
     ) -> list[Model]:
         logging.info("Returning DB entities.")
-        db_model = await YnabServerKnowledgeHelper.get_sk_model(action=action)
+        db_model = serverknowledge.get_sk_model(action=action)
         if since_date and not (year and month):
             todays_date = datetime.today().strftime("%Y-%m-%d")
             logging.debug(f"Returning DB entities from {since_date} to {todays_date}")
@@ -620,39 +616,40 @@ class YnabHelpers:
         db_entities = await queryset.values()
 
         # Return the entities as if they were pydantic models from ynab.
-        db_pydantic_model = await cls.get_pydantic_model(action=action)
-        return TypeAdapter(list[db_pydantic_model]).validate_python(db_entities)
+        db_pydantic_adapter = await cls.get_pydantic_adapter(action=action)
+        return db_pydantic_adapter.validate_python(db_entities)
 
     @classmethod
     async def return_pydantic_model_entities(
-        cls, json_response: json, action: str
+        cls, response: httpx.Response, action: str
     ) -> list[Model]:
+        # Validate the raw response body, rather than parsing it into dicts first.
         match action:
             case "accounts-list":
                 pydantic_accounts_list = AccountsResponse.model_validate_json(
-                    json.dumps(json_response)
+                    response.content
                 )
                 return pydantic_accounts_list.data.accounts
             case "categories-list":
                 pydantic_categories_list = CategoriesResponse.model_validate_json(
-                    json.dumps(json_response)
+                    response.content
                 )
                 return pydantic_categories_list.data.category_groups
             case "months-single":
-                return json_response["data"]["month"]["categories"]
+                return response.json()["data"]["month"]["categories"]
             case "months-list":
                 pydantic_months_list = MonthSummariesResponse.model_validate_json(
-                    json.dumps(json_response)
+                    response.content
                 )
                 return pydantic_months_list.data.months
             case "payees-list":
                 pydantic_payees_list = PayeesResponse.model_validate_json(
-                    json.dumps(json_response)
+                    response.content
                 )
                 return pydantic_payees_list.data.payees
             case "transactions-list":
                 pydantic_transactions_list = TransactionsResponse.model_validate_json(
-                    json.dumps(json_response)
+                    response.content
                 )
                 return pydantic_transactions_list.data.transactions
             case _:
@@ -3,12 +3,14 @@ from calendar import monthrange
 from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
 from itertools import islice
+from statistics import fmean
+from async_lru import alru_cache
 from pypika import CustomFunction
 from tortoise.functions import Sum, Coalesce, Count
 from tortoise.expressions import Q, F
-from numpy import mean
+from pydantic import TypeAdapter
 from app.ynab.helpers import YnabHelpers
-from app.ynab.serverknowledge import YnabServerKnowledgeHelper
+from app.ynab import serverknowledge
 from app.enums import (
     LoansAndRenewalsEnum,
     PeriodMonthOptionsIntEnum,
@@ -31,7 +33,7 @@ from app.ynab.schemas import (
     SubCategorySummary,
     BudgetsNeeded,
     BudgetsDashboard,
-    SubCatBudgetSummary,
+    CatBudgetSummary,
     UpcomingBills,
     CategoryTransactions,
     LoanPortfolio,
@@ -57,6 +59,11 @@ from app.ynab.schemas import (
 TruncMonth = CustomFunction("DATE_TRUNC", ["interval", "field"])
 ToChar = CustomFunction("TO_CHAR", ["field", "format"])
 
+# Validate whole result sets in one pydantic-core call rather than one model at a time.
+TransactionListAdapter = TypeAdapter(list[Transaction])
+CardBillListAdapter = TypeAdapter(list[CardBill])
+DailySpendItemListAdapter = TypeAdapter(list[DailySpendItem])
+
 
 class YNAB:
     CAT_EXPENSE_NAMES = ["Frequent", "Giving", "Non-Monthly Expenses", "Work"]
@@ -81,6 +88,13 @@ class YNAB:
     ]
 
     @classmethod
+    def clear_dashboard_cache(cls) -> None:
+        # The dashboards only change when YNAB is synced or an admin entity is edited.
+        cls.budgets_dashboard.cache_clear()
+        cls.loans_renewals_overview.cache_clear()
+
+    @classmethod
+    @alru_cache(maxsize=1, ttl=3600)
     async def budgets_dashboard(cls) -> BudgetsDashboard:
         budgets = await Budgets.all().prefetch_related("category")
 
@@ -94,48 +108,17 @@ class YNAB:
                 {"name": name, "budgeted": budgeted, "spent": spent}
             )
 
-        raw_results = []
-        for category, subcats in grouped_categories.items():
-            total_budgeted = 0
-            total_spent = 0
-            total_subcats_on_track = 0
-            total_subcats_overspent = 0
-            for subcat in subcats:
-                pydantic_subcat = SubCatBudgetSummary(**subcat)
-                total_budgeted += pydantic_subcat.budgeted
-                total_spent += pydantic_subcat.spent
-                total_subcats_on_track += (
-                    1 if pydantic_subcat.status == "on track" else 0
-                )
-                total_subcats_overspent += (
-                    1 if pydantic_subcat.status != "on track" else 0
-                )
-
-            raw_results.append(
-                {
-                    "name": category,
-                    "budgeted": total_budgeted,
-                    "spent": total_spent,
-                    "on_track": total_subcats_on_track,
-                    "overspent": total_subcats_overspent,
-                    "subcategories": subcats,
-                }
-            )
-
-        total_budgeted = sum(cat["budgeted"] for cat in raw_results)
-        total_on_track = sum(cat["on_track"] for cat in raw_results)
-        total_overspent = sum(cat["overspent"] for cat in raw_results)
-
-        results = sorted(raw_results, key=lambda x: x["spent"], reverse=True)
+        categories = sorted(
+            (
+                CatBudgetSummary(name=category, subcategories=subcats)
+                for category, subcats in grouped_categories.items()
+            ),
+            key=lambda x: x.spent,
+            reverse=True,
+        )
         budgets_needed = await cls.budgets_needed()
 
-        return BudgetsDashboard(
-            total=total_budgeted,
-            on_track=total_on_track,
-            overspent=total_overspent,
-            needed=budgets_needed.count,
-            categories=results,
-        )
+        return BudgetsDashboard(needed=budgets_needed.count, categories=categories)
 
     @classmethod
     async def budgets_needed(cls) -> BudgetsNeeded:
@@ -505,31 +488,6 @@ class YNAB:
             )
         )
 
-        biggest_purchase = (
-            await YnabTransactions.filter(
-                category_fk__category_group_name__iexact=category_name,
-                category_fk__name__iexact=subcategory_name,
-                date__gte=start_date,
-                date__lte=end_date,
-                transfer_account_id__isnull=True,
-                debit=True,
-                deleted=False,
-            )
-            .order_by("-amount")
-            .limit(1)
-            .first()
-            .values(
-                "id",
-                "account_id",
-                "amount",
-                "account_name",
-                "date",
-                category="category_fk__category_group_name",
-                subcategory="category_name",
-                payee="payee_name",
-            )
-        )
-
         card_types = ["BA AMEX", "Barclays CC", "HSBC CC", "HSBC ADVANCE"]
         amex_balance = sum(
             transaction["amount"] if transaction["account_name"] == "BA AMEX" else 0
@@ -575,18 +533,6 @@ class YNAB:
             amex_balance + barclays_balance + hsbc_cc_balance + hsbc_adv_balance
         )
 
-        transaction_count = await YnabTransactions.filter(
-            category_fk__category_group_name__iexact=category_name,
-            category_fk__name__iexact=subcategory_name,
-            date__gte=start_date,
-            date__lte=end_date,
-            transfer_account_id__isnull=True,
-            debit=True,
-            deleted=False,
-        ).count()
-
-        average_purchase = total_balance / transaction_count
-
         total_balance = total_balance - (refunds.total * 1000)
 
         accounts = [
@@ -615,9 +561,6 @@ class YNAB:
         return TransactionSummary(
             total=total_balance,
             accounts=accounts,
-            average_purchase=average_purchase,
-            transaction_count=transaction_count,
-            biggest_purchase=biggest_purchase,
             transactions=transactions,
             refunds=refunds,
         )
@@ -659,14 +602,16 @@ class YNAB:
         logging.debug(f"Transaction dict returned: {transaction_dict}")
 
         # Combine fetched transaction totals with all dates
-        transaction_totals = [
-            DailySpendItem(
-                date=date,
-                total=transaction_dict.get(date, 0),
-                transactions=await cls.transaction_by_date(date=date),
-            )
-            for date in all_dates
-        ]
+        transaction_totals = DailySpendItemListAdapter.validate_python(
+            [
+                {
+                    "date": date,
+                    "total": transaction_dict.get(date, 0),
+                    "transactions": await cls.transaction_by_date(date=date),
+                }
+                for date in all_dates
+            ]
+        )
 
         total = sum(date.total for date in transaction_totals)
 
@@ -788,6 +733,7 @@ class YNAB:
         )
 
     @classmethod
+    @alru_cache(maxsize=1, ttl=3600)
     async def loans_renewals_overview(cls) -> LoanRenewalOverview:
         # Get all subscriptions and insurance entities
         loanrenewalentities = (
@@ -1062,9 +1008,13 @@ class YNAB:
 
             # logging.error(data_entry)
 
-            data.append(CardBill(**data_entry))
+            data.append(data_entry)
 
-        reverse_data = sorted(data, key=lambda item: item.date, reverse=False)
+        reverse_data = sorted(
+            CardBillListAdapter.validate_python(data),
+            key=lambda item: item.date,
+            reverse=False,
+        )
 
         # 6 month trend
         # For the last 6 month (exc. current month), take the first 4 months average
@@ -1078,7 +1028,7 @@ class YNAB:
             for i in range(1, len(reverse_data))
         ]
 
-        avg_trend = round(mean(monthly_changes), 0)
+        avg_trend = round(fmean(monthly_changes), 0)
         last_month_trend = round(monthly_changes[-1], 0)
 
         # Last month diff is for the diff between the 5th month and the 4th month in terms of
@@ -1217,7 +1167,7 @@ class YNAB:
         specific_month: SpecificMonthOptionsEnum = None,
     ):
 
-        return await YnabServerKnowledgeHelper.add_card_payments()
+        return await serverknowledge.add_card_payments()
 
     @classmethod
     async def transactions_by_period(
@@ -1245,7 +1195,7 @@ class YNAB:
 
         logging.debug(f"Found {len(transactions)} transactions for {_filter}")
 
-        return [Transaction(**transaction) for transaction in transactions]
+        return TransactionListAdapter.validate_python(transactions)
 
     @classmethod
     async def transaction_by_date(cls, date: str) -> list[Transaction]:
@@ -1277,7 +1227,7 @@ class YNAB:
 
         logging.debug(f"Found {len(transactions)} transactions for {date}")
 
-        return [Transaction(**transaction) for transaction in transactions]
+        return TransactionListAdapter.validate_python(transactions)
 
     @classmethod
     async def transaction_summary(
@@ -1318,30 +1268,6 @@ class YNAB:
             )
         )
 
-        biggest_purchase = (
-            await YnabTransactions.filter(
-                category_fk__category_group_name__not_in=cls.EXCLUDE_EXPENSE_NAMES,
-                date__gte=start_date,
-                date__lte=end_date,
-                transfer_account_id__isnull=True,
-                debit=True,
-                deleted=False,
-            )
-            .order_by("-amount")
-            .limit(1)
-            .first()
-            .values(
-                "id",
-                "account_id",
-                "amount",
-                "account_name",
-                "date",
-                category="category_fk__category_group_name",
-                subcategory="category_name",
-                payee="payee_name",
-            )
-        )
-
         card_types = ["BA AMEX", "Barclays CC", "HSBC CC", "HSBC ADVANCE"]
         amex_balance = sum(
             transaction["amount"] if transaction["account_name"] == "BA AMEX" else 0
@@ -1383,17 +1309,6 @@ class YNAB:
             amex_balance + barclays_balance + hsbc_cc_balance + hsbc_adv_balance
         )
 
-        transaction_count = await YnabTransactions.filter(
-            category_fk__category_group_name__not_in=cls.EXCLUDE_EXPENSE_NAMES,
-            date__gte=start_date,
-            date__lte=end_date,
-            transfer_account_id__isnull=True,
-            debit=True,
-            deleted=False,
-        ).count()
-
-        average_purchase = total_balance / transaction_count
-
         total_balance = total_balance - (refunds.total * 1000)
 
         accounts = [
@@ -1422,9 +1337,6 @@ class YNAB:
         return TransactionSummary(
             total=total_balance,
             accounts=accounts,
-            average_purchase=average_purchase,
-            transaction_count=transaction_count,
-            biggest_purchase=biggest_purchase,
             transactions=transactions,
             refunds=refunds,
         )
@@ -1,465 +1,490 @@
-from typing import List, Optional
+import sys
+from functools import cached_property
+from typing import Annotated, Dict, List, Optional, Tuple, Union
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator, computed_field
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    model_validator,
+)
 from datetime import date as date_field
+from app.enums import BudgetStatusEnum
 
 
-class Transaction(BaseModel):
+# YNAB amounts are stored in milliunits. The bound float method keeps the division
+# in C, so no Python frame is set up for each money field that gets validated.
+_from_milliunits = (1000.0).__rtruediv__
+
+
+def _from_optional_milliunits(value: float | None) -> float:
+    if value is None:
+        return 0
+    return _from_milliunits(value)
+
+
+Milliunits = Annotated[float, AfterValidator(_from_milliunits)]
+OptionalMilliunits = Annotated[
+    Optional[float], AfterValidator(_from_optional_milliunits)
+]
+
+# Category, type and period names repeat on every row of a response, so only one
+# copy of each distinct value is kept instead of a fresh string per row.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+class LazySchema(BaseModel):
+    # Validators and serializers are only built when a model is first used, so models
+    # that are only ever nested, or back rarely hit endpoints, cost nothing at import.
+    model_config = ConfigDict(defer_build=True)
+
+
+class Transaction(LazySchema):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     account_id: UUID
-    payee: str = Field(..., description="Name of the merchant.")
-    amount: float = Field(
-        ..., description="Amount that was charged against the transaction."
-    )
-    date: date_field = Field(..., description="Date of the transaction being cleared.")
-    category: str | None = Field(..., description="Category of the transaction.")
-    subcategory: str | None = Field(..., description="Subcategory of the transaction.")
+    payee: str  # Name of the merchant.
+    amount: Milliunits  # Amount that was charged against the transaction.
+    date: date_field  # Date of the transaction being cleared.
+    category: Optional[InternedStr]  # Category of the transaction.
+    subcategory: Optional[InternedStr]  # Subcategory of the transaction.
 
-    @field_validator("amount")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
+class CardBill(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class CardBill(BaseModel):
     date: date_field
-    ba_amex: Optional[float] = Field(default=0.0, alias="BA AMEX")
-    hsbc_cc: Optional[float] = Field(default=0.0, alias="HSBC CC")
-    barclays_cc: Optional[float] = Field(default=0.0, alias="Barclays CC")
-
-    @field_validator("ba_amex", "hsbc_cc", "barclays_cc")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    ba_amex: Optional[Milliunits] = Field(default=0.0, alias="BA AMEX")
+    hsbc_cc: Optional[Milliunits] = Field(default=0.0, alias="HSBC CC")
+    barclays_cc: Optional[Milliunits] = Field(default=0.0, alias="Barclays CC")
 
     @computed_field
-    @property
+    @cached_property
     def total(self) -> float:
         return self.ba_amex + self.hsbc_cc + self.barclays_cc
 
 
-class CatBudgetReq(BaseModel):
+class CatBudgetReq(LazySchema):
     name: str
     count: int
     subcategories: List[str]
 
 
-class BudgetsNeeded(BaseModel):
+class BudgetsNeeded(LazySchema):
     count: int
-    categories: Optional[List[CatBudgetReq]] = []
+    categories: List[CatBudgetReq] = Field(default_factory=list)
+
 
+class SubCatBudgetSummary(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class SubCatBudgetSummary(BaseModel):
     name: str
     budgeted: float
-    spent: float
-
-    @field_validator("spent")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    spent: Milliunits
 
     @computed_field
-    @property
-    def status(self) -> str:
+    @cached_property
+    def status(self) -> BudgetStatusEnum:
         if self.spent > self.budgeted:
-            return "overspent"
-        return "on track"
+            return BudgetStatusEnum.OVERSPENT
+        return BudgetStatusEnum.ON_TRACK
 
 
-class CatBudgetSummary(BaseModel):
+class CatBudgetSummary(LazySchema):
     name: str
-    budgeted: float
-    spent: float
+    budgeted: float = 0.0
+    spent: float = 0.0
     on_track: Optional[int] = 0
     overspent: Optional[int] = 0
     subcategories: List[SubCatBudgetSummary]
 
+    @model_validator(mode="after")
+    def sum_subcategories(self) -> "CatBudgetSummary":
+        # Roll the subcategories up in a single pass so the totals always match them.
+        budgeted = spent = 0.0
+        on_track = 0
+        for subcategory in self.subcategories:
+            budgeted += subcategory.budgeted
+            spent += subcategory.spent
+            if subcategory.status is BudgetStatusEnum.ON_TRACK:
+                on_track += 1
+        self.budgeted = budgeted
+        self.spent = spent
+        self.on_track = on_track
+        self.overspent = len(self.subcategories) - on_track
+        return self
+
     @computed_field
     @property
-    def status(self) -> str:
+    def status(self) -> BudgetStatusEnum:
         if self.spent > self.budgeted:
-            return "overspent"
-        return "on track"
+            return BudgetStatusEnum.OVERSPENT
+        return BudgetStatusEnum.ON_TRACK
 
 
-class BudgetsDashboard(BaseModel):
-    total: Optional[float] = 0.0
-    on_track: Optional[int] = 0
-    overspent: Optional[int] = 0
+class BudgetsDashboard(LazySchema):
+    model_config = ConfigDict(frozen=True)
+
     needed: Optional[int] = 0
-    categories: Optional[List[CatBudgetSummary]] = []
+    categories: Tuple[CatBudgetSummary, ...] = ()
+    _total: float = PrivateAttr(default=0.0)
+    _on_track: int = PrivateAttr(default=0)
+    _overspent: int = PrivateAttr(default=0)
+
+    @model_validator(mode="after")
+    def sum_categories(self) -> "BudgetsDashboard":
+        total = 0.0
+        on_track = overspent = 0
+        for category in self.categories:
+            total += category.budgeted
+            on_track += category.on_track
+            overspent += category.overspent
+        self._total = total
+        self._on_track = on_track
+        self._overspent = overspent
+        return self
+
+    @computed_field
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @computed_field
+    @property
+    def on_track(self) -> int:
+        return self._on_track
+
+    @computed_field
+    @property
+    def overspent(self) -> int:
+        return self._overspent
 
 
-class CardBalance(BaseModel):
+class CardBalance(LazySchema):
     id: UUID
-    name: str = Field(..., description="Account name for the card.")
-    balance: float = Field(..., description="Current balance of the card.")
+    name: str  # Account name for the card.
+    balance: Milliunits  # Current balance of the card.
 
-    @field_validator("balance")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
+class CategorySpent(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class CategorySpent(BaseModel):
     name: str
-    spent: float
-    budget: Optional[float] = None
-    total_spent: Optional[float] = None
+    spent: Milliunits
+    budget: Optional[Milliunits] = None
+    total_spent: Optional[Milliunits] = None
 
     @computed_field
-    @property
+    @cached_property
     def progress(self) -> float:
-        if self.budget is None and self.total_spent is None:
+        budget = self.budget
+        if budget:
+            return (self.spent / budget) * 100
+        total_spent = self.total_spent
+        if total_spent:
+            return (self.spent / total_spent) * 100
+        if budget is None and total_spent is None:
             return None
-        if self.budget and self.budget != 0:
-            return (self.spent / self.budget) * 100
-        elif self.total_spent and self.total_spent != 0:
-            return (self.spent / self.total_spent) * 100
         return 0
 
-    @field_validator("spent", "budget", "total_spent")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
-
 
-class SubCategorySummary(BaseModel):
+class SubCategorySummary(LazySchema):
     name: str
-    amount: float
+    amount: Milliunits
     budgeted: float = 0.0
 
-    @field_validator("amount")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        if value is None:
-            return 0
-        return value / 1000.0
-
     @computed_field
     @property
     def progress(self) -> float:
-        if self.budgeted is None and self.amount is None:
-            return None
-        if self.amount >= self.budgeted:
+        budgeted = self.budgeted
+        if self.amount >= budgeted:
             return 100
-        if self.budgeted and self.budgeted != 0:
-            return (self.amount / self.budgeted) * 100
-        return 0
+        return (self.amount / budgeted) * 100 if budgeted else 0
 
     @computed_field
     @property
-    def status(self) -> str:
+    def status(self) -> BudgetStatusEnum:
         if self.amount > self.budgeted:
-            return "overspent"
-        return "on track"
+            return BudgetStatusEnum.OVERSPENT
+        return BudgetStatusEnum.ON_TRACK
 
 
-class CategorySummary(BaseModel):
+class CategorySummary(LazySchema):
     id: Optional[UUID] = None
     category: Optional[str] = None
-    amount: float
+    amount: Milliunits
     budgeted: float = 0.0
-    subcategories: List[SubCategorySummary]
-
-    @field_validator("amount")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        if value is None:
-            return 0
-        return value / 1000.0
+    subcategories: Tuple[SubCategorySummary, ...]
 
     @computed_field
     @property
-    def status(self) -> str:
+    def status(self) -> BudgetStatusEnum:
         if self.amount > self.budgeted:
-            return "overspent"
-        return "on track"
+            return BudgetStatusEnum.OVERSPENT
+        return BudgetStatusEnum.ON_TRACK
 
 
-class CreditAccount(BaseModel):
+class CreditAccount(LazySchema):
     id: Optional[UUID] = None
     date: Optional[date_field] = None
-    amount: Optional[float] = None
+    amount: OptionalMilliunits = None
     account_name: str
 
-    @field_validator("amount")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        if value is None:
-            return 0
-        return value / 1000.0
-
 
-class Refunds(BaseModel):
+class Refunds(LazySchema):
     count: int = 0
-    total: float = 0.0
-    transactions: Optional[List[Transaction]] = []
-
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    total: Milliunits = 0.0
+    transactions: Tuple[Transaction, ...] = ()
 
 
 # TODO clean up the transaction details to be a separate class
-class TransactionSummary(BaseModel):
-    total: float
-    accounts: List[CardBalance]
-    transactions: List[Transaction]
-    average_purchase: float
-    transaction_count: int
-    biggest_purchase: Optional[Transaction] = None
+class TransactionSummary(LazySchema):
+    # average_purchase, transaction_count and biggest_purchase are derived from the
+    # transactions, so passing them in is an error rather than silently ignored.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    total: Milliunits
+    accounts: Tuple[CardBalance, ...]
+    transactions: Tuple[Transaction, ...]
     refunds: Refunds
+    _average_purchase: float = PrivateAttr(default=0.0)
+    _biggest_purchase: Optional[Transaction] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def summarise_transactions(self) -> "TransactionSummary":
+        # The transactions are already here, no need to ask the db for the same rows.
+        biggest = None
+        for transaction in self.transactions:
+            if biggest is None or transaction.amount > biggest.amount:
+                biggest = transaction
+        if self.transactions:
+            # Only the card account balances count towards the average, transactions
+            # on any other account are left out.
+            card_spend = sum(account.balance for account in self.accounts)
+            self._average_purchase = card_spend / len(self.transactions)
+        self._biggest_purchase = biggest
+        return self
 
-    @field_validator("total", "average_purchase")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    @computed_field
+    @property
+    def average_purchase(self) -> float:
+        return self._average_purchase
+
+    @computed_field
+    @property
+    def transaction_count(self) -> int:
+        return len(self.transactions)
+
+    @computed_field
+    @property
+    def biggest_purchase(self) -> Optional[Transaction]:
+        return self._biggest_purchase
 
 
-class DirectDebitSummary(BaseModel):
+class DirectDebitSummary(LazySchema):
     count: int
     monthly_cost: float
     yearly_cost: float
 
 
-class IncomeVsExpense(BaseModel):
+class IncomeVsExpense(LazySchema):
     month: str
     year: str
-    income: float
-    expenses: float
-
-    @field_validator("income", "expenses")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    income: Milliunits
+    expenses: Milliunits
 
 
-class Insurance(BaseModel):
+class Insurance(LazySchema):
     id: UUID
     name: str
     payment_amount: float
     start_date: date_field
     end_date: Optional[date_field] = None
-    period: Optional[str] = None
-    provider: Optional[str] = None
+    period: Optional[InternedStr] = None
+    provider: Optional[InternedStr] = None
     notes: Optional[str] = None
 
 
-class LoanPortfolio(BaseModel):
+class LoanPortfolio(LazySchema):
     count: int
     total_credit: float
     accounts: List[dict]
 
 
-class MonthIncomeExpenses(BaseModel):
-    balance_available: float
-    balance_spent: float
-    income: float
-    bills: float
-    savings: float
+class MonthIncomeExpenses(LazySchema):
+    balance_available: Milliunits
+    balance_spent: Milliunits
+    income: Milliunits
+    bills: Milliunits
+    savings: Milliunits
 
-    @field_validator("balance_available", "balance_spent", "income", "bills", "savings")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
-
-class MonthSummary(BaseModel):
+class MonthSummary(LazySchema):
     days_left: int
-    balance_available: float
-    balance_spent: float
+    balance_available: Milliunits
+    balance_spent: Milliunits
     balance_budget: float
-    daily_spend: float
-
-    @field_validator("balance_available", "balance_spent", "daily_spend")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    daily_spend: Milliunits
 
 
-class Month(BaseModel):
+class Month(LazySchema):
     notif: str | None
     summary: MonthSummary
     income_expenses: MonthIncomeExpenses
 
 
-class SubCategorySpentResponse(BaseModel):
+class SubCategorySpentResponse(LazySchema):
     since_date: date_field
     data: List[CategorySpent]
 
 
-class TransactionByMonth(BaseModel):
+class TransactionByMonth(LazySchema):
     month_long: str
     month_short: str
-    total_spent: float
-    total_earned: float
-
-    @field_validator("total_spent", "total_earned")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    total_spent: Milliunits
+    total_earned: Milliunits
 
 
-class TransactionsByMonthResponse(BaseModel):
+class TransactionsByMonthResponse(LazySchema):
     since_date: date_field
     data: List[TransactionByMonth]
 
 
-class BillTransaction(BaseModel):
-    memo: Optional[str] = None
-    payee: str = Field(..., description="Name of the merchant.")
-    amount: float = Field(
-        ..., description="Amount that was charged against the transaction."
-    )
-    date: date_field = Field(..., description="Date of the transaction being cleared.")
-    subcategory: str | None = Field(..., description="Subcategory of the transaction.")
+class BillTransaction(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator("amount")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
+    memo: Optional[str] = None
+    payee: str  # Name of the merchant.
+    amount: Milliunits  # Amount that was charged against the transaction.
+    date: date_field  # Date of the transaction being cleared.
+    subcategory: Optional[InternedStr]  # Subcategory of the transaction.
 
 
-class BillCategory(BaseModel):
+class BillCategory(LazySchema):
     name: str
-    amount: float
+    amount: Milliunits
     transactions: List[BillTransaction]
 
-    @field_validator("amount")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
-
-class LoanRenewalCategory(BaseModel):
+class LoanRenewalCategory(LazySchema):
     name: str
     date: date_field
     amount: float
 
 
-class LoanRenewalCounts(BaseModel):
+class LoanRenewalCounts(LazySchema):
     insurance: int = 0
     loans: int = 0
     subscriptions: int = 0
 
 
-class LoanRenewalEntity(BaseModel):
+class LoanRenewalEntity(LazySchema):
+    model_config = ConfigDict(frozen=True)
+
     count: int
     total: float
-    type: str
-    period: str
+    type: InternedStr
+    period: InternedStr
 
+    @computed_field
+    @cached_property
+    def annual_total(self) -> float:
+        if self.period == "yearly":
+            return self.total
+        return self.total * 12
 
-class LoanRenewalTotals(BaseModel):
-    data: List[LoanRenewalEntity] = []
 
-    @computed_field
-    @property
-    def insurance(self) -> float:
-        total = 0
+class LoanRenewalTotals(LazySchema):
+    model_config = ConfigDict(frozen=True)
+
+    data: List[LoanRenewalEntity] = Field(default_factory=list)
+    _totals: Dict[str, float] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def sum_yearly_totals(self) -> "LoanRenewalTotals":
+        # Walk the entities once, adding each yearly cost to its type's total.
+        totals = {"insurance": 0, "loan": 0, "subscription": 0}
         for entity in self.data:
-            if entity.type != "insurance":
-                continue
+            if entity.type in totals:
+                totals[entity.type] += entity.annual_total
 
-            if entity.period == "yearly":
-                total += entity.total
-            else:
-                total += entity.total * 12
+        self._totals = totals
+        return self
 
-        return round(total)
+    @computed_field
+    @property
+    def insurance(self) -> float:
+        return round(self._totals["insurance"])
 
     @computed_field
     @property
     def loans(self) -> float:
-        total = 0
-        for entity in self.data:
-            if entity.type != "loan":
-                continue
-
-            if entity.period == "yearly":
-                total += entity.total
-            else:
-                total += entity.total * 12
-
-        return round(total)
+        return round(self._totals["loan"])
 
     @computed_field
     @property
     def subscriptions(self) -> float:
-        total = 0
-        for entity in self.data:
-            if entity.type != "subscription":
-                continue
-
-            if entity.period == "yearly":
-                total += entity.total
-            else:
-                total += entity.total * 12
+        return round(self._totals["subscription"])
 
-        return round(total)
 
-
-class LoanRenewalCreditSummary(BaseModel):
-    total: float = 0.0
+class LoanRenewalCreditSummary(LazySchema):
+    total: Milliunits = 0.0
     limit: float = 41500  # Default based on July 2024 credit values
 
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
-
     @computed_field
     @property
     def utilisation(self) -> float:
-        try:
-            return round(((self.total / self.limit) * 100))
-        except ZeroDivisionError:
-            return 0
+        limit = self.limit
+        return round((self.total / limit) * 100) if limit else 0
+
+
+class LoanEntitySummary(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class LoanEntitySummary(BaseModel):
     name: str
-    provider: Optional[str]
+    provider: Optional[InternedStr]
     end_date: date_field
     starting_balance: float = 0.0
     remaining_balance: float = 0.0
 
     @computed_field
-    @property
+    @cached_property
     def paid_balance(self) -> float:
         return self.starting_balance - self.remaining_balance
     
     @computed_field
-    @property
+    @cached_property
     def progress(self) -> float:
         return (self.paid_balance / self.starting_balance) * 100
     
 
-class SubscriptionEntitySummary(BaseModel):
+class SubscriptionEntitySummary(LazySchema):
     name: str
-    provider: Optional[str]
+    provider: Optional[InternedStr]
     payment_amount: float = 0.0
     start_date: date_field
-    period: str
+    period: InternedStr
 
-class LoanRenewalLoanSummary(BaseModel):
+class LoanRenewalLoanSummary(LazySchema):
     remaining_balance: float = 0.0
     debt: float = 0.0
-    data: List[LoanEntitySummary] = []
+    data: List[LoanEntitySummary] = Field(default_factory=list)
 
     @computed_field
     @property
     def paid(self) -> float:
         return self.debt - self.remaining_balance
 
-class LoanRenewalSubscriptionSummary(BaseModel):
+class LoanRenewalSubscriptionSummary(LazySchema):
     totals_monthly: float = 0.0
     totals_yearly: float = 0.0
-    data: List[LoanEntitySummary] = []
+    data: List[LoanEntitySummary] = Field(default_factory=list)
 
-class LoanRenewalOverview(BaseModel):
+class LoanRenewalOverview(LazySchema):
     counts: LoanRenewalCounts
     credit: LoanRenewalCreditSummary
     loans: LoanRenewalLoanSummary
@@ -467,46 +492,33 @@ class LoanRenewalOverview(BaseModel):
     totals: LoanRenewalTotals
 
 
-class CategoryTrends(BaseModel):
+class CategoryTrends(LazySchema):
     period: str
     trend: str
-    avg_spend: float
-    percentage: float | str
+    avg_spend: Milliunits
+    percentage: Annotated[Union[float, str], Field(union_mode="left_to_right")]
 
-    @field_validator("avg_spend")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
+class CategoryTrendItem(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class CategoryTrendItem(BaseModel):
     month: str
-    total: float
+    total: Milliunits
 
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
-
-class CategoryTrendSummary(BaseModel):
-    data: Optional[List[CategoryTrendItem]] = []
+class CategoryTrendSummary(LazySchema):
+    data: List[CategoryTrendItem] = Field(default_factory=list)
     summary: List[CategoryTrends]
 
 
-class CategoryTransactions(BaseModel):
-    total: float
+class CategoryTransactions(LazySchema):
+    total: Milliunits
     on_track: Optional[bool] = None
     budget: float
     trends: CategoryTrendSummary
 
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
-
 
-class UpcomingBills(BaseModel):
+class UpcomingBills(LazySchema):
     total: float
     total_bills: float
     count_bills: int
@@ -517,54 +529,54 @@ class UpcomingBills(BaseModel):
     renewals: Optional[List[LoanRenewalCategory]] = None
 
 
-class PastBillsSummary(BaseModel):
+class PastBillsSummary(LazySchema):
     last_month_diff: float
     last_month_trend: float
     avg_trend: float
 
 
-class PastBills(BaseModel):
+class PastBills(LazySchema):
     summary: PastBillsSummary
     data: List[CardBill]
 
 
-class MonthSavingsCalc(BaseModel):
-    total: float
+class MonthSavingsCalc(LazySchema):
+    total: Milliunits
 
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
+class DailySpendItem(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class DailySpendItem(BaseModel):
     date: date_field
-    total: Optional[float] = 0.0
-    transactions: Optional[List[Transaction]] = []
+    total: Optional[Milliunits] = 0.0
+    transactions: List[Transaction] = Field(default_factory=list)
 
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
+class DailySpendSummary(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class DailySpendSummary(BaseModel):
     total: float
-    days: List[DailySpendItem]
+    days: Tuple[DailySpendItem, ...]
+
 
+class Payee(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class Payee(BaseModel):
     payee_name: str
     count: int
-    total: float
+    total: Milliunits
 
-    @field_validator("total")
-    def format_milliunits(cls, value):
-        # Convert the integer value to milliunits (assuming it's in microunits)
-        return value / 1000.0
 
+class PayeeSummary(LazySchema):
+    model_config = ConfigDict(frozen=True)
 
-class PayeeSummary(BaseModel):
     count: int = 0
     topspender: Optional[Payee] = None
-    data: List[Payee] = []
+    data: Tuple[Payee, ...] = ()
+
+
+def build_schemas() -> None:
+    # Build every deferred validator and serializer at start up, so the first request
+    # to each endpoint doesn't have to. Importing the module stays cheap.
+    for schema in LazySchema.__subclasses__():
+        schema.model_rebuild()
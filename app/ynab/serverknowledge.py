@@ -1,16 +1,16 @@
 import logging
-import re
+from itertools import chain
 from datetime import datetime, UTC
+from functools import lru_cache
+from uuid import UUID
 from fastapi import HTTPException
 from tortoise.models import Model
-from tortoise.exceptions import (
-    IncompleteInstanceError,
-    IntegrityError,
-    FieldError,
-)
-from deepdiff import DeepDiff
+from tortoise.transactions import in_transaction
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import BaseORMException, FieldError
 from app.config import settings
 from app.db.models import (
+    CardPayments,
     YnabServerKnowledge,
     YnabAccounts,
     YnabCategories,
@@ -19,389 +19,418 @@ from app.db.models import (
     YnabPayees,
     YnabTransactions,
 )
-from app.reactadmin.helpers import ReactAdmin as ra
 
+logger = logging.getLogger(__name__)
+
+# Routes which accept the last_knowledge_of_server param.
+_SK_ROUTES = frozenset(
+    (
+        "accounts-list",
+        "categories-list",
+        "months-list",
+        "payees-list",
+        "transactions-list",
+    )
+)
+
+# The key each route's entities sit under in the YNAB response data.
+_DATA_NAMES = {
+    "accounts-list": "accounts",
+    "categories-list": "category_groups",
+    "months-list": "months",
+    "payees-list": "payees",
+    "transactions-list": "transactions",
+}
+
+# The DB model each route's entities are stored in.
+_SK_MODELS = {
+    "accounts-list": YnabAccounts,
+    "categories-list": YnabCategories,
+    "months-single": YnabMonthDetailCategories,
+    "months-list": YnabMonthSummaries,
+    "payees-list": YnabPayees,
+    "transactions-list": YnabTransactions,
+}
+
+# The amount fields YNAB sends as negatives, stored as positive values.
+_NEGATIVE_FIELDS = {
+    YnabAccounts: ("balance", "cleared_balance", "uncleared_balance"),
+    YnabCategories: ("activity", "balance"),
+    YnabMonthDetailCategories: ("activity", "balance"),
+    YnabMonthSummaries: ("activity",),
+    YnabTransactions: ("amount",),
+}
+
+# Default for dict lookups where None is a valid value.
+_MISSING = object()
+
+# The DB columns of each synced model, looked up once per model class.
+_DB_FIELDS_CACHE: dict[type[Model], frozenset[str]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> datetime:
+    # Transactions share a handful of dates, so most rows hit the cache.
+    # Set the TZ as comparisons can fail if there are timezone issues.
+    return datetime.fromisoformat(value).replace(tzinfo=UTC)
+
+
+async def add_card_payments(models: list[Model] | None = None):
+    if not models:
+        start_date = datetime.now().replace(
+            day=1, month=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        end_date = datetime.now()
 
-class YnabServerKnowledgeHelper:
-    negative_amounts = [
-        YnabTransactions,
-        YnabMonthSummaries,
-        YnabMonthDetailCategories,
-        YnabCategories,
-        YnabAccounts,
+        transactions = await YnabTransactions.filter(
+            transfer_account_id__isnull=False,
+            account_name__not="HSBC ADVANCE",
+            date__gte=start_date,
+            date__lte=end_date,
+        )
+    else:
+        transactions = models
+
+    # Skip the transactions which already have a card payment stored, rather than
+    # trying to insert them again. Any stored by another sync since this lookup are
+    # skipped by ignore_conflicts on the insert. The ids are compared as strings, as
+    # models built from the YNAB JSON hold them as str rather than UUID.
+    existing_payments = {
+        str(transaction_id)
+        for transaction_id in await CardPayments.filter(
+            transaction_id__in=[transaction.id for transaction in transactions]
+        ).values_list("transaction_id", flat=True)
+    }
+    transactions = [
+        transaction
+        for transaction in transactions
+        if str(transaction.id) not in existing_payments
     ]
 
-    @classmethod
-    async def add_card_payments(cls, model: Model = None):
-        transactions = []
-        if not model:
-            start_date = datetime.now().replace(
-                day=1, month=1, hour=0, minute=0, second=0, microsecond=0
-            )
-            end_date = datetime.now()
+    if transactions:
+        await CardPayments.bulk_create(
+            [
+                CardPayments(
+                    account_id=transaction.account_id, transaction_id=transaction.id
+                )
+                for transaction in transactions
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
 
-            transactions = await YnabTransactions.filter(
-                transfer_account_id__isnull=False,
-                account_name__not="HSBC ADVANCE",
-                date__gte=start_date,
-                date__lte=end_date,
-            )
-        else:
-            transactions.append(model)
-
-        for transaction in transactions:
-            entity = {
-                "account_id": transaction.account_id,
-                "transaction_id": transaction.id,
-            }
-            try:
-                logging.debug("Attempting to create card payment entity.")
-                await ra.create(resource="card-payments", resp_body=entity)
-            except IntegrityError:
-                logging.info("figure this out")
-
-        return {"message": "done"}
-
-    @classmethod
-    async def create_switch_negative_values(cls, model: Model) -> Model:
-        if type(model) == YnabAccounts:
-            if model.balance < 0:
-                model.balance = -model.balance
-            if model.cleared_balance < 0:
-                model.cleared_balance = -model.cleared_balance
-            if model.uncleared_balance < 0:
-                model.uncleared_balance = -model.uncleared_balance
-        elif type(model) == YnabCategories or type(model) == YnabMonthDetailCategories:
-            if model.activity < 0:
-                model.activity = -model.activity
-            if model.balance < 0:
-                model.balance = -model.balance
-        elif type(model) == YnabMonthSummaries:
-            if model.activity < 0:
-                model.activity = -model.activity
-        elif type(model) == YnabTransactions:
-            if model.amount < 0:
-                model.amount = -model.amount
-
-        return model
-
-    @classmethod
-    async def update_switch_negative_values(
-        cls, model: Model, resp_body: dict
-    ) -> Model:
-        if type(model) == YnabAccounts:
-            if resp_body["balance"] < 0:
-                resp_body["balance"] = -resp_body["balance"]
-            if resp_body["cleared_balance"] < 0:
-                resp_body["cleared_balance"] = -resp_body["cleared_balance"]
-            if resp_body["uncleared_balance"] < 0:
-                resp_body["uncleared_balance"] = -resp_body["uncleared_balance"]
-        elif type(model) == YnabCategories or type(model) == YnabMonthDetailCategories:
-            if resp_body["activity"] < 0:
-                resp_body["activity"] = -resp_body["activity"]
-            if resp_body["balance"] < 0:
-                resp_body["balance"] = -resp_body["balance"]
-        elif type(model) == YnabMonthSummaries:
-            if resp_body["activity"] < 0:
-                resp_body["activity"] = -resp_body["activity"]
-        elif type(model) == YnabTransactions:
-            if resp_body["amount"] < 0:
-                resp_body["amount"] = -resp_body["amount"]
-
-        return resp_body
-
-    @classmethod
-    async def add_server_knowledge_to_url(
-        cls, ynab_url: str, server_knowledge: int
-    ) -> bool:
-        # If a ? exists in the URL then append the additional param.
-        if "?" in ynab_url:
-            return f"{ynab_url}&last_knowledge_of_server={server_knowledge}"
-
-        # Otherwise add a ? and include the sk param.
-        return f"{ynab_url}?last_knowledge_of_server={server_knowledge}"
-
-    @classmethod
-    async def check_if_exists(cls, route_url: str) -> YnabServerKnowledge | None:
-        return await YnabServerKnowledge.get_or_none(route=route_url)
-
-    @classmethod
-    async def check_route_eligibility(cls, action: str) -> bool:
-        capable_routes = [
-            "accounts-list",
-            "categories-list",
-            "months-list",
-            "payees-list",
-            "transactions-list",
-        ]
-        return action in capable_routes
-
-    @classmethod
-    async def create_route_entities(cls, model: Model) -> int | IntegrityError:
-        if type(model) == YnabTransactions:
-            model.debit = False if model.amount > 0 else True
-
-        if type(model) in cls.negative_amounts:
-            model = await cls.create_switch_negative_values(model)
+    return {"message": "done"}
 
-        try:
-            await model.save()
-            # Need to save the card payment after the transaction has been saved
-            if (
-                model.transfer_account_id != None
-                and model.account_name != "HSBC ADVANCE"
-                and model.payee_name == 'Transfer : HSBC ADVANCE'
-            ):
-                await cls.add_card_payments(model=model)
-            return 1
-        except IncompleteInstanceError as e_incomplete:
-            logging.exception(
-                "Model is partial and the fields are not available for persistence",
-                exc_info=e_incomplete,
-            )
-            return 0
-        except IntegrityError:
-            raise IntegrityError
-
-    @classmethod
-    async def create_update_server_knowledge(
-        cls, route: str, server_knowledge: int, db_entity: YnabServerKnowledge = None
-    ) -> YnabServerKnowledge:
-        try:
-            if db_entity:
-                logging.debug(
-                    f"Updating server knowledge for {route} to {server_knowledge}"
-                )
-                db_entity.last_updated = datetime.today()
-                db_entity.server_knowledge = server_knowledge
-                await db_entity.save()
-                return db_entity
-            logging.debug(
-                f"Creating server knowledge for {route} to {server_knowledge}"
-            )
-            return await YnabServerKnowledge.create(
-                budget_id=settings.ynab_budget_id,
-                route=route,
-                last_updated=datetime.today(),
-                server_knowledge=server_knowledge,
-            )
-        except Exception as exc:
-            logging.exception("Issue create/update server knowledge.", exc_info=exc)
-            raise HTTPException(status_code=500)
-
-    @classmethod
-    async def get_route_data_name(cls, action: str) -> str | HTTPException:
-        data_name_list = {
-            "accounts-list": "accounts",
-            "categories-list": "category_groups",
-            "months-list": "months",
-            "payees-list": "payees",
-            "transactions-list": "transactions",
-        }
 
-        try:
-            return data_name_list[action]
-        except KeyError:
-            logging.warning(f"Data name for {action} doesn't exist.")
-            raise HTTPException(status_code=400)
-
-    @classmethod
-    async def get_sk_model(cls, action: str) -> Model | HTTPException:
-        model_list = {
-            "accounts-list": YnabAccounts,
-            "categories-list": YnabCategories,
-            "months-single": YnabMonthDetailCategories,
-            "months-list": YnabMonthSummaries,
-            "payees-list": YnabPayees,
-            "transactions-list": YnabTransactions,
-        }
+def create_switch_negative_values(model: Model) -> Model:
+    for field in _NEGATIVE_FIELDS.get(type(model), ()):
+        setattr(model, field, abs(getattr(model, field)))
 
-        try:
-            return model_list[action]
-        except KeyError:
-            logging.warning(f"Model for {action} doesn't exist.")
-            raise HTTPException(status_code=400)
-
-    @classmethod
-    async def pop_new_field_from_response(
-        cls, resp_body: dict, new_items_added: list[str]
-    ) -> dict:
-        logging.debug(
-            f"{len(new_items_added)} new field(s) from YNAB attempting to remove them."
-        )
+    return model
 
-        pattern = r"root\['([^']+)'\]"
 
-        for new_field in new_items_added:
-            match = re.search(pattern, new_field)
-            try:
-                key_to_pop = match.group(1)
-            except IndexError:
-                logging.error("Issue with regex trying to extract key to pop.")
-                raise IndexError
-            resp_body.pop(key_to_pop)
-            logging.debug(f"Removed {new_field} from the response body.")
+def update_switch_negative_values(model: Model, resp_body: dict) -> dict:
+    for field in _NEGATIVE_FIELDS.get(type(model), ()):
+        resp_body[field] = abs(resp_body[field])
 
-        return resp_body
+    return resp_body
 
-    @classmethod
-    async def remove_unused_fields(cls, model: Model, resp_body: dict) -> dict:
-        # Get the DB fields (returns a set)
-        db_fields = model._meta.db_fields
-        resp_fields = set(resp_body.keys())
 
-        diff = DeepDiff(t1=db_fields, t2=resp_fields)
+def add_server_knowledge_to_url(ynab_url: str, server_knowledge: int) -> str:
+    # If a ? exists in the URL then append the additional param.
+    if "?" in ynab_url:
+        return f"{ynab_url}&last_knowledge_of_server={server_knowledge}"
 
-        try:
-            new_items_added = diff["set_item_added"]
-        except KeyError:
-            return resp_body
+    # Otherwise add a ? and include the sk param.
+    return f"{ynab_url}?last_knowledge_of_server={server_knowledge}"
 
-        if new_items_added:
-            resp_body = await cls.pop_new_field_from_response(
-                resp_body=resp_body, new_items_added=new_items_added
-            )
 
-        return resp_body
+async def check_if_exists(route_url: str) -> YnabServerKnowledge | None:
+    return await YnabServerKnowledge.get_or_none(route=route_url)
 
-    @classmethod
-    async def update_route_entities(cls, model: Model, resp_body: dict) -> int:
-        try:
-            entity_id = resp_body["id"]
-            resp_body.pop("id")
-        except KeyError:  # Happens on 'months-list' as no ID is returned.
-            resp_month_dt = datetime.strptime(resp_body["month"], "%Y-%m-%d")
-            resp_month_dt = resp_month_dt.replace(
-                tzinfo=UTC
-            )  # This can fail if there are timezone issues. So ensure the TZ is set.
-            # logging.debug(f"datetime has been set to: {resp_month_dt}")
-            db_entity = await model.filter(month=resp_month_dt).get()
-            entity_id = db_entity.id
-            resp_body.pop(
-                "month"
-            )  # Need to pop the month as it doesnt need to be updated.
-
-        # Make sure all the fields which aren't supported on the DB are removed.
-        resp_body = await cls.remove_unused_fields(model=model, resp_body=resp_body)
-
-        # Make sure any dates passed into the update is a datetime value, not a string if its a transaction.
-        if type(model) == YnabTransactions:
-            resp_body["debit"] = False if resp_body["amount"] > 0 else True
-
-            # Set the category ID for those that may have changed.
-            resp_body["category_fk_id"] = resp_body["category_id"]
-            logging.debug(
-                f"Attempting to set Category to transaction: {resp_body['category_id']}"
+
+def check_route_eligibility(action: str) -> bool:
+    return action in _SK_ROUTES
+
+
+def create_route_entities(model: Model) -> Model:
+    if model.__class__ is YnabTransactions:
+        model.debit = False if model.amount > 0 else True
+
+    return create_switch_negative_values(model)
+
+
+async def create_update_server_knowledge(
+    route: str, server_knowledge: int, db_entity: YnabServerKnowledge | None = None
+) -> YnabServerKnowledge:
+    try:
+        if db_entity:
+            logger.debug(
+                "Updating server knowledge for %s to %s", route, server_knowledge
             )
+            db_entity.last_updated = datetime.now(UTC)
+            db_entity.server_knowledge = server_knowledge
+            await db_entity.save()
+            return db_entity
+        logger.debug("Creating server knowledge for %s to %s", route, server_knowledge)
+        return await YnabServerKnowledge.create(
+            budget_id=settings.ynab_budget_id,
+            route=route,
+            last_updated=datetime.now(UTC),
+            server_knowledge=server_knowledge,
+        )
+    except Exception as exc:
+        logger.exception("Issue create/update server knowledge.", exc_info=exc)
+        raise HTTPException(status_code=500)
+
+
+def get_route_data_name(action: str) -> str | HTTPException:
+    try:
+        return _DATA_NAMES[action]
+    except KeyError:
+        logger.warning("Data name for %s doesn't exist.", action)
+        raise HTTPException(status_code=400)
+
+
+def get_sk_model(action: str) -> Model | HTTPException:
+    try:
+        return _SK_MODELS[action]
+    except KeyError:
+        logger.warning("Model for %s doesn't exist.", action)
+        raise HTTPException(status_code=400)
+
+
+def get_unused_fields(model: type[Model], resp_body: dict) -> tuple[str, ...]:
+    db_fields = _DB_FIELDS_CACHE.get(model)
+    if db_fields is None:
+        db_fields = _DB_FIELDS_CACHE[model] = frozenset(model._meta.db_fields)
+
+    # Any fields YNAB returns which the DB model doesn't have.
+    return tuple(resp_body.keys() - db_fields)
+
+
+def update_route_entities(
+    model: Model,
+    resp_body: dict,
+    unused_fields: tuple[str, ...] = (),
+    month_ids: dict[str, UUID] | None = None,
+) -> tuple[UUID | str, dict]:
+    entity_id = resp_body.pop("id", _MISSING)
+    if entity_id is _MISSING:  # Happens on 'months-list' as no ID is returned.
+        # Need to pop the month as it doesnt need to be updated.
+        entity_id = month_ids[resp_body.pop("month")]
+
+    # Make sure all the fields which aren't supported on the DB are removed.
+    for field in unused_fields:
+        resp_body.pop(field, None)
+
+    # Make sure any dates passed into the update is a datetime value, not a string if its a transaction.
+    if model.__class__ is YnabTransactions:
+        resp_body["debit"] = False if resp_body["amount"] > 0 else True
+
+        # Set the category ID for those that may have changed.
+        resp_body["category_fk_id"] = resp_body["category_id"]
+        logger.debug(
+            "Attempting to set Category to transaction: %s",
+            resp_body["category_id"],
+        )
+
+        raw_date = resp_body.get("date")
+        if raw_date is None:
+            logger.warning("No date in response body.")
+        else:
+            resp_body["date"] = _parse_date(raw_date)
 
-            try:
-                raw_date = resp_body.get("date")
-                resp_date_dt = datetime.strptime(raw_date, "%Y-%m-%d")
-                resp_date_dt = resp_date_dt.replace(tzinfo=UTC)
-                resp_body["date"] = resp_date_dt
-                # logging.debug(f"Converted datetime: {resp_date_dt}")
-            except KeyError:
-                logging.warning("No date in response body.")
+    resp_body = update_switch_negative_values(model, resp_body)
 
-        if type(model) in cls.negative_amounts:
-            resp_body = await cls.update_switch_negative_values(model, resp_body)
+    return entity_id, resp_body
 
-        try:
-            await model.filter(id=entity_id).update(**resp_body)
-            logging.debug("Entity updated.")
-            return 1
-        except FieldError as e_field:
-            logging.warning("Additional field identified in model", exc_info=e_field)
-            return 0
-
-    @classmethod
-    async def process_entities(cls, action: str, entities: dict) -> dict:
-        if action == "categories-list":
-            # Need to loop on each of the category groups as they are not presented as one full list.
-            entity_list = []
-            for group in entities:
-                for category in group["categories"]:
-                    entity_list.append(category)
+
+async def process_entities(action: str, entities: dict) -> dict:
+    if action == "categories-list":
+        # Each category group holds its own categories, so flatten them into one.
+        entity_list = list(
+            chain.from_iterable(group["categories"] for group in entities)
+        )
+    else:
+        entity_list = entities
+
+    model_cls = get_sk_model(action)
+    # Look up which entities are already stored in one query, rather than trying
+    # to insert each one and falling back to an update when it already exists.
+    month_ids = None
+    if action == "months-list":
+        # Months are not returned with an ID, they are unique on the month instead.
+        month_ids = {
+            month.strftime("%Y-%m-%d"): month_id
+            for month, month_id in await model_cls.filter(
+                month__isnull=False
+            ).values_list("month", "id")
+        }
+        existing_keys = month_ids.keys()
+        entity_key = "month"
+    else:
+        existing_keys = {
+            str(entity_id)
+            for entity_id in await model_cls.filter(
+                id__in=[entity["id"] for entity in entity_list]
+            ).values_list("id", flat=True)
+        }
+        entity_key = "id"
+
+    # YNAB returns the same fields for every entity on a route, so only the first
+    # entity needs checking for fields the DB model doesn't have.
+    unused_fields = ()
+    if entity_list:
+        unused_fields = get_unused_fields(model_cls, entity_list[0])
+        if unused_fields:
+            logger.debug(
+                "%s new field(s) from YNAB, removing them.", len(unused_fields)
+            )
+
+    new_entities = []
+    updated_entities = []
+    skipped = 0
+    logger.debug("Processing %s entities.", len(entity_list))
+    for entity in entity_list:
+        if entity["deleted"] == True:
+            skipped += 1
+            continue
+
+        model = return_sk_model(action=action, kwargs=entity)
+        if entity[entity_key] not in existing_keys:
+            new_entities.append(create_route_entities(model=model))
+        elif model.__class__ is YnabPayees:
+            # Payees do not change once entered. No need to update them.
+            skipped += 1
         else:
-            entity_list = entities
-
-        created = 0
-        skipped = 0
-        updated = 0
-        logging.debug(f"Processing {len(entity_list)} entities.")
-        for entity in entity_list:
-            if entity["deleted"] == True:
-                skipped += 1
-                continue
-
-            model = await YnabModelResponses.return_sk_model(
-                action=action, kwargs=entity
+            updated_entities.append(
+                update_route_entities(
+                    model=model,
+                    resp_body=entity,
+                    unused_fields=unused_fields,
+                    month_ids=month_ids,
+                )
             )
-            # logging.debug(f"Model body: {entity}")
-            try:
-                created += await cls.create_route_entities(model=model)
-            except IntegrityError:
-                if type(model) == YnabPayees:
-                    # Payees do not change once entered. No need to update them.
-                    skipped += 1
-                    continue
-                updated += await cls.update_route_entities(
-                    model=model, resp_body=entity
+
+    created = 0
+    updated = 0
+    # Commit the whole sync at once instead of once per batch. Any error other than
+    # a conflict on insert rolls back every create and update in the sync.
+    try:
+        async with in_transaction() as connection:
+            if new_entities:
+                await model_cls.bulk_create(
+                    new_entities,
+                    batch_size=500,
+                    ignore_conflicts=True,
+                    using_db=connection,
+                )
+                # Conflicting rows are silently dropped, so count the ones that made it.
+                created = (
+                    await model_cls.filter(id__in=[model.id for model in new_entities])
+                    .using_db(connection)
+                    .count()
                 )
 
-        logging.info(
-            f"""
-            Created: {created}
-            Updated: {updated}
-            Skipped: {skipped}
-            Issues: {len(entities) - (created + updated + skipped)}
-            """
+            if updated_entities:
+                updated = await update_entities(model_cls, updated_entities, connection)
+    except BaseORMException:
+        logger.exception(
+            "Sync of %s rolled back, %s create(s) and %s update(s) discarded.",
+            action,
+            len(new_entities),
+            len(updated_entities),
+        )
+        raise
+
+    # Need to save the card payments after the transactions have been saved.
+    card_payments = [
+        model
+        for model in new_entities
+        if model.__class__ is YnabTransactions
+        and model.transfer_account_id != None
+        and model.account_name != "HSBC ADVANCE"
+        and model.payee_name == "Transfer : HSBC ADVANCE"
+    ]
+    if card_payments:
+        await add_card_payments(models=card_payments)
+
+    logger.info(
+        """
+        Created: %s
+        Updated: %s
+        Skipped: %s
+        Issues: %s
+        """,
+        created,
+        updated,
+        skipped,
+        len(entity_list) - (created + updated + skipped),
+    )
+    return {"message": "Complete"}
+
+
+async def update_entities(
+    model_cls: type[Model],
+    updated_entities: list[tuple[UUID | str, dict]],
+    connection: BaseDBAsyncClient,
+) -> int:
+    # YNAB returns the same fields for every entity on a route, so the fields of the
+    # first entity are updated in bulk. Any entity with other fields is done alone.
+    update_fields = updated_entities[0][1].keys()
+    bulk_entities = []
+    single_entities = []
+    for entity_id, resp_body in updated_entities:
+        if resp_body.keys() == update_fields:
+            bulk_entities.append((entity_id, resp_body))
+        else:
+            single_entities.append((entity_id, resp_body))
+
+    updated = 0
+    try:
+        await model_cls.bulk_update(
+            [
+                model_cls(id=entity_id, **resp_body)
+                for entity_id, resp_body in bulk_entities
+            ],
+            fields=list(update_fields),
+            batch_size=500,
+            using_db=connection,
         )
-        return {"message": "Complete"}
-
-
-class YnabModelResponses:
-    @classmethod
-    async def return_sk_model(cls, action: str, kwargs: dict) -> Model | HTTPException:
-        match action:
-            case "accounts-list":
-                return await cls.create_account(kwargs=kwargs)
-            case "categories-list":
-                return await cls.create_category(kwargs=kwargs)
-            case "months-single":
-                return await cls.create_month_detail(kwargs=kwargs)
-            case "months-list":
-                return await cls.create_month_summary(kwargs=kwargs)
-            case "payees-list":
-                return await cls.create_payee(kwargs=kwargs)
-            case "transactions-list":
-                # Two fields which should be ignored
-                # flag_name, subtransactions
-                return await cls.create_transactions(kwargs=kwargs)
-            case _:
-                logging.warning(f"Model for {action} doesn't exist.")
-                raise HTTPException(status_code=400)
-
-    @classmethod
-    async def create_account(cls, kwargs: dict) -> YnabAccounts:
-        return YnabAccounts(**kwargs)
-
-    @classmethod
-    async def create_category(cls, kwargs: dict) -> YnabCategories:
-        return YnabCategories(**kwargs)
-
-    @classmethod
-    async def create_month_detail(cls, kwargs: dict) -> YnabMonthDetailCategories:
-        return YnabMonthDetailCategories(**kwargs)
-
-    @classmethod
-    async def create_month_summary(cls, kwargs: dict) -> YnabMonthSummaries:
-        return YnabMonthSummaries(**kwargs)
-
-    @classmethod
-    async def create_payee(cls, kwargs: dict) -> YnabPayees:
-        return YnabPayees(**kwargs)
-
-    @classmethod
-    async def create_transactions(cls, kwargs: dict) -> YnabTransactions:
-        return YnabTransactions(**kwargs)
+        updated = len(bulk_entities)
+    except FieldError as e_field:
+        logger.warning(
+            "Bulk update failed for fields %s, updating %s entities one at a time.",
+            list(update_fields),
+            len(bulk_entities),
+            exc_info=e_field,
+        )
+        single_entities = updated_entities
+
+    for entity_id, resp_body in single_entities:
+        try:
+            await model_cls.filter(id=entity_id).using_db(connection).update(
+                **resp_body
+            )
+            updated += 1
+        except FieldError as e_field:
+            logger.warning(
+                "Entity %s not updated, fields %s don't match the model.",
+                entity_id,
+                list(resp_body),
+                exc_info=e_field,
+            )
+
+    return updated
+
+
+def return_sk_model(action: str, kwargs: dict) -> Model | HTTPException:
+    try:
+        model = _SK_MODELS[action]
+    except KeyError:
+        logger.warning("Model for %s doesn't exist.", action)
+        raise HTTPException(status_code=400)
+
+    # Fields the models don't have (e.g. flag_name, subtransactions) are ignored.
+    return model(**kwargs)